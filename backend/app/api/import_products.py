@@ -1,18 +1,19 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
 import shutil
 import os
 import uuid
-import openpyxl
 import json
 import io
 
-from app.parser.csv_excel_reader import read_file
+from app.core.dependencies import get_shopify_client
+from app.parser.csv_excel_reader import read_records
 from app.parser.normalizer import normalize_row
 from app.parser.grouper import group_products
 from app.parser.validator import validate_products
 from app.services.product_merge import ProductMergeService
+from app.services.variant_patch import VariantPatchService, is_variant_patch_file
+from app.shopify.client import ShopifyClient
 from fastapi.responses import StreamingResponse
-from openpyxl import Workbook
 
 router = APIRouter(prefix="/import", tags=["Import"])
 
@@ -26,27 +27,33 @@ def download_import_result(result_id: str):
     with open(result_path, "r") as f:
         row_results = json.load(f)
 
+    # openpyxl is only needed for the report, keep it off the startup path
+    from openpyxl import Workbook
+
     wb = Workbook()
     ws = wb.active
     ws.title = "Import Results"
 
-    # Collect all column names dynamically
-    all_columns = set()
+    # Collect all column names dynamically (sheets may have different columns)
+    all_columns = {}
     for r in row_results:
-        all_columns.update((r.get("data") or {}).keys())
+        all_columns.update(dict.fromkeys((r.get("data") or {}).keys()))
 
     all_columns = list(all_columns)
 
+    has_sheets = any(r.get("sheet") for r in row_results)
+
     # Header
-    headers = ["Row"] + list(row_results[0]["data"].keys()) + ["Status", "Error"]
+    headers = (["Sheet"] if has_sheets else []) + ["Row"] + all_columns + ["Status", "Error"]
     ws.append(headers)
 
     # Rows
     for r in row_results:
-        row_data = r.get("data", {})
+        row_data = r.get("data") or {}
         ws.append(
+            ([r.get("sheet")] if has_sheets else []) +
             [r.get("row")] +
-            [row_data.get(h, "") for h in headers[1:-2]] +
+            [row_data.get(h, "") for h in all_columns] +
             [r.get("status"), r.get("error")]
         )
 
@@ -64,15 +71,24 @@ def download_import_result(result_id: str):
     )
 
 @router.post("/products")
-def import_products(file: UploadFile = File(...)):
+def import_products(
+    file: UploadFile = File(...),
+    sheets: str | None = Form(None),
+    client: ShopifyClient = Depends(get_shopify_client),
+):
     temp_filename = f"/tmp/{uuid.uuid4()}_{file.filename}"
 
     with open(temp_filename, "wb") as buffer:
         shutil.copyfileobj(file.file, buffer)
 
     try:
-        # Parse file
-        rows = read_file(temp_filename)
+        # Parse file (optionally only a comma separated subset of sheets)
+        sheet_names = [s.strip() for s in sheets.split(",") if s.strip()] if sheets else None
+
+        try:
+            records = read_records(temp_filename, sheet_names)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
         row_results = []
 
@@ -83,7 +99,11 @@ def import_products(file: UploadFile = File(...)):
 
         seen_skus = set()
 
-        for index, row in enumerate(rows, start=2):  # start=2 CSV header is row 1
+        for record in records:
+                index = record["row"]
+                sheet = record["sheet"]
+                row = record["data"]
+
                 try:
                     normalized_row = normalize_row(row, index)
 
@@ -93,6 +113,7 @@ def import_products(file: UploadFile = File(...)):
                     if sku:
                         if sku in seen_skus:
                             row_results.append({
+                                "sheet": sheet,
                                 "row": index,
                                 "status": "skipped",
                                 "error": f"Duplicate SKU '{sku}' found in same import. Row skipped.",
@@ -106,6 +127,7 @@ def import_products(file: UploadFile = File(...)):
                     normalized.append(normalized_row)
 
                     row_results.append({
+                        "sheet": sheet,
                         "row": index,
                         "sku": sku,
                         "status": "pending",
@@ -116,11 +138,46 @@ def import_products(file: UploadFile = File(...)):
                     
                 except ValueError as e:
                     row_errors.append({
+                        "sheet": sheet,
                         "row": index,
                         "status": "error",
                         "error": str(e)
                     })
 
+        # Price / weight list: skip the product path entirely
+        columns = {column for record in records for column in record["data"]}
+
+        if is_variant_patch_file(columns):
+            merge_service = ProductMergeService(client)
+            patch_service = VariantPatchService(client)
+
+            outcomes = patch_service.apply(normalized, merge_service.build_catalog_index())
+
+            # pending results line up with `normalized`; in-file duplicates keep their own status
+            pending_results = [r for r in row_results if r["status"] == "pending"]
+
+            for r, outcome in zip(pending_results, outcomes):
+                r["status"] = outcome["status"]
+                r["error"] = outcome["error"]
+
+            patch_errors = [
+                {"row": r["row"], "sheet": r["sheet"], "sku": r["sku"], "error": r["error"]}
+                for r in pending_results
+                if r["status"] == "error"
+            ]
+
+            summary = {
+                "mode": "variant_patch",
+                "products_created": 0,
+                "products_updated": 0,
+                "variants_created": 0,
+                "variants_updated": sum(1 for o in outcomes if o["status"] == "updated"),
+                "errors": row_errors + patch_errors,
+            }
+            summary["download_id"] = _save_row_results(row_results)
+
+            return summary
+
         # Group products
         grouped = group_products(normalized)
 
@@ -141,7 +198,20 @@ def import_products(file: UploadFile = File(...)):
             }
 
 
-        merge_service = ProductMergeService()
+        merge_service = ProductMergeService(client)
+
+        # Flag SKUs owned by other Shopify products/variants before any writes
+        sku_index = merge_service.build_sku_index()
+        valid_products, sku_conflicts = merge_service.find_sku_conflicts(valid_products, sku_index)
+
+        conflict_errors = {conflict["sku"]: conflict["error"] for conflict in sku_conflicts}
+
+        for r in row_results:
+            if r["status"] == "pending" and r.get("sku") in conflict_errors:
+                r["status"] = "skipped"
+                r["error"] = conflict_errors[r["sku"]]
+
+        row_errors.extend(sku_conflicts)
 
         # Summary response
         summary = {
@@ -216,16 +286,20 @@ def import_products(file: UploadFile = File(...)):
             summary.setdefault("errors", [])
             summary["errors"].extend(result.get("errors", []))
 
-        result_id = str(uuid.uuid4())
-        result_path = f"/tmp/import_result_{result_id}.json"
-
-        with open(result_path, "w") as f:
-            json.dump(row_results, f)
-
-        summary["download_id"] = result_id
+        summary["download_id"] = _save_row_results(row_results)
 
         return summary
 
     finally:
         if os.path.exists(temp_filename):
             os.remove(temp_filename)
+
+
+def _save_row_results(row_results) -> str:
+    result_id = str(uuid.uuid4())
+    result_path = f"/tmp/import_result_{result_id}.json"
+
+    with open(result_path, "w") as f:
+        json.dump(row_results, f)
+
+    return result_id
@@ -3,9 +3,18 @@ import os
 
 load_dotenv()
 
-SHOPIFY_STORE_URL = os.getenv("SHOPIFY_STORE_URL")
-SHOPIFY_ACCESS_TOKEN = os.getenv("SHOPIFY_ACCESS_TOKEN")
-SHOPIFY_API_VERSION = os.getenv("SHOPIFY_API_VERSION", "2024-01")
 
-if not SHOPIFY_STORE_URL or not SHOPIFY_ACCESS_TOKEN:
-    raise RuntimeError("Missing required Shopify configuration")
+def get_shopify_config() -> dict:
+    # Read (and validate) at call time so importing the app never fails on missing env vars
+    store_url = os.getenv("SHOPIFY_STORE_URL")
+    access_token = os.getenv("SHOPIFY_ACCESS_TOKEN")
+    api_version = os.getenv("SHOPIFY_API_VERSION", "2024-01")
+
+    if not store_url or not access_token:
+        raise RuntimeError("Missing required Shopify configuration")
+
+    return {
+        "store_url": store_url,
+        "access_token": access_token,
+        "api_version": api_version,
+    }
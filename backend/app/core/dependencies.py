@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from app.shopify.client import ShopifyClient
+
+
+def get_shopify_client(request: Request) -> ShopifyClient:
+    # Shared client created once in the app lifespan (see app.main)
+    return request.app.state.shopify_client
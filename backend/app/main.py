@@ -1,10 +1,13 @@
 import os
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Depends
 from dotenv import load_dotenv
 from pathlib import Path
 from app.shopify.client import ShopifyClient
+from app.core.dependencies import get_shopify_client
 from app.api.import_products import router as import_router
+from app.parser.csv_excel_reader import shutdown_sheet_pool
 from fastapi.middleware.cors import CORSMiddleware
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -12,7 +15,21 @@ ENV_PATH = BASE_DIR / ".env"
 
 load_dotenv(dotenv_path=ENV_PATH)
 
-app = FastAPI(title="Shopify Product Import Engine")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One Shopify client (and connection pool) for the whole process.
+    # Missing Shopify config fails startup on purpose: a worker that cannot
+    # reach Shopify should never pass /health and receive traffic.
+    app.state.shopify_client = ShopifyClient()
+    try:
+        yield
+    finally:
+        app.state.shopify_client.close()
+        shutdown_sheet_pool()
+
+
+app = FastAPI(title="Shopify Product Import Engine", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -29,7 +46,5 @@ def health():
     return {"status": "ok"}
 
 @app.get("/shopify/test")
-def shopify_test():
-    client = ShopifyClient()
+def shopify_test(client: ShopifyClient = Depends(get_shopify_client)):
     return client.get_products()
-
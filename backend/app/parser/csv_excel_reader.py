@@ -1,21 +1,186 @@
-import pandas as pd
-from typing import List, Dict
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
-def read_file(file_path: str) -> List[Dict]:
-    
+# pandas / openpyxl are imported inside the functions that use them:
+# they are slow to import and only needed once a file is actually parsed.
+
+# One process pool shared by all requests, capped so concurrent uploads
+# cannot multiply worker processes. "spawn" avoids forking the
+# multithreaded server process.
+MAX_SHEET_WORKERS = min(4, os.cpu_count() or 1)
+
+_sheet_pool: Optional[ProcessPoolExecutor] = None
+_sheet_pool_lock = threading.Lock()
+
+
+def read_file(file_path: str, sheets: Optional[List[str]] = None) -> List[Dict]:
+
+    return [record["data"] for record in read_records(file_path, sheets)]
+
+
+def read_records(file_path: str, sheets: Optional[List[str]] = None) -> List[Dict]:
+    """
+    Read every row of a CSV / Excel file together with its provenance:
+    {"sheet": <sheet name or None>, "row": <row number in the sheet>, "data": <row dict>}
+
+    Blank rows are dropped but still counted, so "row" is the
+    row number in the original file.
+
+    For .xlsx files all sheets (or only `sheets`) are read, each
+    sheet streamed in read-only mode by the shared worker pool.
+    """
+
     path = Path(file_path)
 
     if not path.exists():
         raise FileNotFoundError(f"File not found: {file_path}")
 
-    if path.suffix.lower() == ".csv":
-        df = pd.read_csv(path)
-    elif path.suffix.lower() in [".xls", ".xlsx"]:
-        df = pd.read_excel(path)
-    else:
-        raise ValueError("Unsupported file type. Only CSV and Excel are supported.")
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        import pandas as pd
+
+        # keep blank lines so the DataFrame index maps to file rows
+        df = pd.read_csv(path, skip_blank_lines=False)
+        return _records_from_dataframe(df, None)
 
+    if suffix == ".xls":
+        import pandas as pd
+
+        frames = pd.read_excel(path, sheet_name=sheets or None)
+        records = []
+        for sheet_name, df in frames.items():
+            records.extend(_records_from_dataframe(df, sheet_name))
+        return records
+
+    if suffix == ".xlsx":
+        return _read_workbook(str(path), sheets)
+
+    raise ValueError("Unsupported file type. Only CSV and Excel are supported.")
+
+
+def shutdown_sheet_pool():
+    global _sheet_pool
+
+    with _sheet_pool_lock:
+        if _sheet_pool is not None:
+            _sheet_pool.shutdown()
+            _sheet_pool = None
+
+
+def _get_sheet_pool() -> ProcessPoolExecutor:
+    global _sheet_pool
+
+    with _sheet_pool_lock:
+        if _sheet_pool is None:
+            _sheet_pool = ProcessPoolExecutor(
+                max_workers=MAX_SHEET_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _sheet_pool
+
+
+def _records_from_dataframe(df, sheet_name) -> List[Dict]:
+    import pandas as pd
+
+    df = df.dropna(how="all")
     df = df.where(pd.notnull(df), None)
 
-    return df.to_dict(orient="records")
+    # row 1 is the header, index 0 is row 2
+    return [
+        {"sheet": sheet_name, "row": int(index) + 2, "data": data}
+        for index, data in zip(df.index, df.to_dict(orient="records"))
+    ]
+
+
+def _read_workbook(file_path: str, sheets: Optional[List[str]]) -> List[Dict]:
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True)
+    try:
+        available = wb.sheetnames
+    finally:
+        wb.close()
+
+    if sheets:
+        missing = [s for s in sheets if s not in available]
+        if missing:
+            raise ValueError(f"Sheet(s) not found in workbook: {', '.join(missing)}")
+        sheet_names = [s for s in available if s in sheets]
+    else:
+        sheet_names = available
+
+    if len(sheet_names) == 1:
+        results = [_read_sheet(file_path, sheet_names[0])]
+    else:
+        # map keeps workbook sheet order
+        results = _get_sheet_pool().map(_read_sheet, [file_path] * len(sheet_names), sheet_names)
+
+    records = []
+    for sheet_name, (columns, rows) in zip(sheet_names, results):
+        for index, values in rows:
+            data = dict.fromkeys(c for c in columns if c is not None)
+            data.update(
+                (column, value)
+                for column, value in zip(columns, values)
+                if column is not None
+            )
+            records.append({"sheet": sheet_name, "row": index, "data": data})
+
+    return records
+
+
+def _read_sheet(file_path: str, sheet_name: str) -> Tuple[List[Optional[str]], List[Tuple[int, tuple]]]:
+
+    # Runs in a worker process: open the workbook independently and stream one sheet.
+    # Rows go back as plain tuples (cheaper to pickle than dicts).
+    import openpyxl
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+
+    try:
+        rows = wb[sheet_name].iter_rows(values_only=True)
+
+        header = next(rows, None)
+        if not header:
+            return [], []
+
+        columns = _unique_columns(header)
+
+        values_by_row = [
+            (index, values)
+            for index, values in enumerate(rows, start=2)
+            if values and not all(v is None for v in values)
+        ]
+
+        return columns, values_by_row
+
+    finally:
+        wb.close()
+
+
+def _unique_columns(header) -> List[Optional[str]]:
+
+    # Same naming as pandas for repeated headers: "Tags", "Tags.1", "Tags.2"
+    columns = []
+    seen = {}
+
+    for c in header:
+        if c is None or not str(c).strip():
+            columns.append(None)
+            continue
+
+        name = str(c).strip()
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+
+        columns.append(name)
+
+    return columns
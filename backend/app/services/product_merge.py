@@ -1,11 +1,12 @@
 import math
-from typing import Dict, Any
+from typing import Dict, Any, List
 from app.shopify.client import ShopifyClient
 
 
 class ProductMergeService:
-    def __init__(self):
-        self.client = ShopifyClient()
+    def __init__(self, client: ShopifyClient | None = None):
+        # Reuse the app-wide client when given, so imports share its connection pool
+        self.client = client or ShopifyClient()
 
     def find_existing_product(self, product: Dict[str, Any]) -> Dict | None:
         """
@@ -30,6 +31,109 @@ class ProductMergeService:
                 return existing
         return None
 
+    def build_sku_index(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Build a SKU -> [{product_id, variant_id, handle, sku, price,
+        compare_at_price, weight, weight_unit}] index from a single
+        export of the whole Shopify catalog.
+
+        A SKU can already be shared by several Shopify variants,
+        so every owner is kept.
+        """
+
+        return self.build_catalog_index()["skus"]
+
+    def build_catalog_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Same single catalog export, indexed both ways:
+        {"skus": SKU -> [variant entries], "variants": variant ID (str) -> variant entry}
+        """
+
+        sku_index = {}
+        variant_index = {}
+
+        for shopify_product in self.client.iter_products():
+            for v in shopify_product.get("variants", []):
+                entry = {
+                    "product_id": shopify_product["id"],
+                    "variant_id": v["id"],
+                    "handle": shopify_product.get("handle"),
+                    "sku": v.get("sku"),
+                    "price": v.get("price"),
+                    "compare_at_price": v.get("compare_at_price"),
+                    "weight": v.get("weight"),
+                    "weight_unit": v.get("weight_unit"),
+                }
+
+                variant_index[str(v["id"])] = entry
+                if entry["sku"]:
+                    sku_index.setdefault(entry["sku"], []).append(entry)
+
+        return {"skus": sku_index, "variants": variant_index}
+
+    def find_sku_conflicts(self, products: List[Dict[str, Any]], sku_index: Dict[str, List[Dict[str, Any]]]):
+        """
+        Flag every incoming SKU that already belongs to another
+        Shopify product/variant, before any writes happen.
+
+        Conflicting variants are removed from their product. Products
+        left without variants are dropped.
+        Returns (products, conflicts).
+        """
+
+        remaining_products = []
+        conflicts = []
+
+        for product in products:
+            variants = product.get("variants", [])
+            kept_variants = []
+
+            for incoming in variants:
+                sku = incoming.get("sku")
+                owners = sku_index.get(sku, []) if sku else []
+
+                # every owner must be the targeted product/variant
+                owner = next((o for o in owners if not self._owns_sku(o, product, incoming)), None)
+
+                if owner:
+                    conflicts.append({
+                        "sku": sku,
+                        "error": (
+                            "Duplicate SKU already exists in Shopify "
+                            f"(product {owner['product_id']}, variant {owner['variant_id']})"
+                        ),
+                    })
+                    continue
+
+                kept_variants.append(incoming)
+
+            if variants and not kept_variants:
+                continue
+
+            product["variants"] = kept_variants
+            remaining_products.append(product)
+
+        return remaining_products, conflicts
+
+    def _owns_sku(self, owner: Dict[str, Any], product: Dict[str, Any], incoming: Dict[str, Any]) -> bool:
+
+        # Incoming row must target the same product (by ID or Handle)
+        same_product = (
+            (product.get("id") and str(product["id"]) == str(owner["product_id"]))
+            or (product.get("handle") and product["handle"] == owner.get("handle"))
+        )
+        if not same_product:
+            return False
+
+        # and, if it names a variant, the same variant
+        variant_id = incoming.get("id")
+        if variant_id is not None and not (isinstance(variant_id, float) and math.isnan(variant_id)):
+            if isinstance(variant_id, float):
+                variant_id = int(variant_id)
+            return str(variant_id) == str(owner["variant_id"])
+
+        return True
+
     def merge_product_fields(self, existing: Dict, incoming: Dict) -> Dict:
 
         update = {}
@@ -92,12 +196,6 @@ class ProductMergeService:
         product_id = shopify_product["id"]
         shopify_variants = self.client.get_variants_for_product(product_id)
 
-        shopify_sku_map = {}
-        for v in shopify_variants:
-            sku = v.get("sku")
-            if sku:
-                shopify_sku_map[sku] = v["id"]
-
         results = {
             "created": [],
             "updated": [],
@@ -110,16 +208,7 @@ class ProductMergeService:
             sku = incoming.get("sku")
             existing = self.find_existing_variant(shopify_variants, incoming)
 
-            if sku in shopify_sku_map:
-                shopify_variant_id = shopify_sku_map[sku]
-
-                if not existing or existing["id"] != shopify_variant_id:
-                    results["skipped"].append(sku)
-                    results["errors"].append({
-                        "sku": sku,
-                        "error": "Duplicate SKU already exists in Shopify",
-                    })
-                    continue
+            # SKUs owned by other variants were already dropped by find_sku_conflicts
 
             payload = self.merge_variant_fields(incoming)
 
@@ -0,0 +1,237 @@
+import math
+from typing import Dict, Any, List, Iterable
+from app.shopify.client import ShopifyClient
+
+
+# Files made only of these columns are price/weight lists: no product-level fields
+VARIANT_PATCH_COLUMNS = {
+    "Handle",
+    "Variant ID",
+    "Variant SKU",
+    "Variant Price",
+    "Variant Compare At Price",
+    "Variant Weight",
+}
+
+# REST weight_unit -> GraphQL WeightUnit
+WEIGHT_UNITS = {
+    "kg": "KILOGRAMS",
+    "g": "GRAMS",
+    "lb": "POUNDS",
+    "oz": "OUNCES",
+}
+
+# First Admin API version where weight moved to inventoryItem.measurement
+MEASUREMENT_API_VERSION = "2024-04"
+
+
+def is_variant_patch_file(columns: Iterable[str]) -> bool:
+
+    columns = {c for c in columns if c}
+
+    has_key = "Variant SKU" in columns or "Variant ID" in columns
+
+    return has_key and columns <= VARIANT_PATCH_COLUMNS
+
+
+class VariantPatchService:
+    def __init__(self, client: ShopifyClient | None = None, products_per_request: int = 25):
+        self.client = client or ShopifyClient()
+        # each aliased productVariantsBulkUpdate costs ~10 points of the GraphQL bucket
+        self.products_per_request = products_per_request
+
+    def build_variant_patch(self, incoming: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ProductVariantsBulkInput fields whose value differs from Shopify.
+        Empty cells are left untouched.
+        """
+
+        patch = {}
+
+        for field, key in [("price", "price"), ("compare_at_price", "compareAtPrice")]:
+            value = incoming.get(field)
+            if not _is_blank(value) and not _same_number(value, current.get(field)):
+                patch[key] = str(value)
+
+        weight = incoming.get("weight")
+        if not _is_blank(weight) and not _same_number(weight, current.get("weight")):
+            # the file has no unit column: keep the variant's current unit
+            unit = WEIGHT_UNITS.get(current.get("weight_unit"), "KILOGRAMS")
+
+            if self.client.api_version >= MEASUREMENT_API_VERSION:
+                patch["inventoryItem"] = {
+                    "measurement": {"weight": {"value": weight, "unit": unit}}
+                }
+            else:
+                patch["weight"] = weight
+                patch["weightUnit"] = unit
+
+        return patch
+
+    def resolve_variant(self, incoming: Dict[str, Any], catalog: Dict[str, Dict[str, Any]]):
+        """
+        Find the Shopify variant a row targets: Variant ID first, then SKU.
+        Returns (variant entry, None) or (None, error message).
+        """
+
+        sku = incoming.get("sku")
+        variant_id = _to_id(incoming.get("id"))
+
+        if variant_id:
+            current = catalog["variants"].get(variant_id)
+
+            if not current:
+                return None, f"Variant ID {variant_id} not found in Shopify"
+
+            if sku and current.get("sku") != sku:
+                return None, (
+                    f"Variant ID {variant_id} has SKU '{current.get('sku')}' in Shopify, not '{sku}'"
+                )
+
+            return current, None
+
+        owners = catalog["skus"].get(sku, []) if sku else []
+
+        if not owners:
+            return None, "SKU not found in Shopify (price/weight updates cannot create variants)"
+
+        if len(owners) > 1:
+            return None, f"SKU is shared by {len(owners)} Shopify variants, cannot tell which to update"
+
+        return owners[0], None
+
+    def apply(self, rows: List[Dict[str, Any]], catalog: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        rows: normalized rows ({"product", "variant"}) as produced by normalize_row.
+        catalog: ProductMergeService.build_catalog_index()
+
+        Resolves each row to a Shopify variant and sends batched
+        price/weight updates, without any product reads or writes.
+        Returns one {"sku", "status", "error"} outcome per row, in order.
+        """
+
+        outcomes = [
+            {"sku": row["variant"].get("sku"), "status": "pending", "error": ""}
+            for row in rows
+        ]
+
+        # product_id -> [(row position, variant input)]
+        pending: Dict[int, List] = {}
+
+        # Variant-ID-only rows are not covered by the in-file SKU check
+        seen_variant_ids = set()
+
+        for position, row in enumerate(rows):
+            incoming = row["variant"]
+            outcome = outcomes[position]
+
+            current, error = self.resolve_variant(incoming, catalog)
+
+            if error:
+                outcome.update(status="error", error=error)
+                continue
+
+            handle = row["product"].get("handle")
+            if handle and current.get("handle") and handle != current["handle"]:
+                outcome.update(
+                    status="error",
+                    error=f"Variant belongs to product '{current['handle']}', not '{handle}'",
+                )
+                continue
+
+            if current["variant_id"] in seen_variant_ids:
+                outcome.update(
+                    status="skipped",
+                    error=f"Duplicate variant {current['variant_id']} found in same import. Row skipped.",
+                )
+                continue
+
+            seen_variant_ids.add(current["variant_id"])
+
+            patch = self.build_variant_patch(incoming, current)
+            if not patch:
+                outcome.update(status="skipped", error="No price/weight changes")
+                continue
+
+            pending.setdefault(current["product_id"], []).append(
+                (position, {"id": current["variant_id"], **patch})
+            )
+
+        product_ids = list(pending)
+
+        for start in range(0, len(product_ids), self.products_per_request):
+            batch = {pid: pending[pid] for pid in product_ids[start:start + self.products_per_request]}
+            self._send_batch(batch, outcomes)
+
+        return outcomes
+
+    def _send_batch(self, batch: Dict[int, List], outcomes: List[Dict[str, Any]]):
+
+        try:
+            user_errors = self.client.bulk_update_variants(
+                {pid: [v for _, v in variants] for pid, variants in batch.items()}
+            )
+        except Exception as e:
+            if len(batch) > 1:
+                # one bad product must not fail the others: retry one product per request
+                for pid, variants in batch.items():
+                    self._send_batch({pid: variants}, outcomes)
+                return
+
+            for variants in batch.values():
+                for position, _ in variants:
+                    outcomes[position].update(status="error", error=str(e))
+            return
+
+        for pid, variants in batch.items():
+            failed = _failed_variants(variants, user_errors.get(pid, []))
+
+            for position, _ in variants:
+                if position in failed:
+                    outcomes[position].update(status="error", error=failed[position])
+                else:
+                    outcomes[position].update(status="updated", error="")
+
+
+def _failed_variants(variants: List, user_errors: List[Dict[str, Any]]) -> Dict[Any, str]:
+
+    # variants: [(key, variant input)] in the order they were sent
+    failed = {}
+
+    for err in user_errors:
+        field = err.get("field") or []
+
+        # field looks like ["variants", "<index>", "price"]
+        if len(field) > 1 and field[0] == "variants" and str(field[1]).isdigit() and int(field[1]) < len(variants):
+            targets = [variants[int(field[1])][0]]
+        else:
+            targets = [key for key, _ in variants]
+
+        for key in targets:
+            failed[key] = err.get("message", "Variant update failed")
+
+    return failed
+
+
+def _to_id(value):
+    if _is_blank(value):
+        return None
+    if isinstance(value, float):
+        value = int(value)
+    value = str(value).strip()
+    return value or None
+
+
+def _is_blank(value) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _same_number(value, current) -> bool:
+
+    if current is None or current == "":
+        return False
+
+    try:
+        return round(float(value), 4) == round(float(current), 4)
+    except (ValueError, TypeError):
+        return False
@@ -1,33 +1,43 @@
+import time
 import httpx
-from typing import Dict
+from typing import Dict, List
 
-from app.core.config import (
-    SHOPIFY_STORE_URL,
-    SHOPIFY_ACCESS_TOKEN,
-    SHOPIFY_API_VERSION,
-)
-
-BASE_URL = f"https://{SHOPIFY_STORE_URL}/admin/api/{SHOPIFY_API_VERSION}"
-
-HEADERS = {
-    "X-Shopify-Access-Token": SHOPIFY_ACCESS_TOKEN,
-    "Content-Type": "application/json",
-}
+from app.core.config import get_shopify_config
 
 
 class ShopifyClient:
-    def __init__(self):
-        self.client = httpx.Client(headers=HEADERS, timeout=30)
-
+    def __init__(self, max_connections: int = 20):
+        config = get_shopify_config()
+
+        self.api_version = config["api_version"]
+        self.base_url = f"https://{config['store_url']}/admin/api/{self.api_version}"
+
+        headers = {
+            "X-Shopify-Access-Token": config["access_token"],
+            "Content-Type": "application/json",
+        }
+
+        # One pooled, keep-alive client per ShopifyClient; share the instance instead of recreating it
+        self.client = httpx.Client(
+            headers=headers,
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+
+    def close(self):
+        self.client.close()
 
     def get_products(self, limit=5):
-        url = f"{BASE_URL}/products.json"
+        url = f"{self.base_url}/products.json"
         response = self.client.get(url, params={"limit": limit})
         response.raise_for_status()
         return response.json()
 
     def get_product_by_id(self, product_id: int):
-        url = f"{BASE_URL}/products/{product_id}.json"
+        url = f"{self.base_url}/products/{product_id}.json"
         response = self.client.get(url)
         if response.status_code == 404:
             return None
@@ -35,20 +45,33 @@ class ShopifyClient:
         return response.json().get("product")
 
     def get_product_by_handle(self, handle: str):
-        url = f"{BASE_URL}/products.json"
+        url = f"{self.base_url}/products.json"
         response = self.client.get(url, params={"handle": handle})
         response.raise_for_status()
         products = response.json().get("products", [])
         return products[0] if products else None
 
+    def iter_products(self, fields: str = "id,handle,variants", limit: int = 250):
+        # Walks the whole catalog using cursor (page_info) pagination
+        url = str(httpx.URL(f"{self.base_url}/products.json", params={"limit": limit, "fields": fields}))
+
+        while url:
+            response = self._send("GET", url)
+            response.raise_for_status()
+            yield from response.json().get("products", [])
+
+            # Follow the next link exactly as given: passing params would
+            # replace its query string and drop page_info
+            url = response.links.get("next", {}).get("url")
+
     def create_product(self, payload: dict):
-        url = f"{BASE_URL}/products.json"
+        url = f"{self.base_url}/products.json"
         response = self.client.post(url, json={"product": payload})
         response.raise_for_status()
         return response.json().get("product")
 
     def update_product(self, product_id: int, payload: dict):
-        url = f"{BASE_URL}/products/{product_id}.json"
+        url = f"{self.base_url}/products/{product_id}.json"
         response = self.client.put(url, json={"product": payload})
         response.raise_for_status()
         return response.json().get("product")
@@ -56,21 +79,91 @@ class ShopifyClient:
 
 
     def get_variants_for_product(self, product_id: int):
-        url = f"{BASE_URL}/products/{product_id}.json"
+        url = f"{self.base_url}/products/{product_id}.json"
         response = self.client.get(url)
         response.raise_for_status()
         product = response.json().get("product", {})
         return product.get("variants", [])
 
     def update_variant(self, variant_id: int, payload: dict):
-        url = f"{BASE_URL}/variants/{variant_id}.json"
+        url = f"{self.base_url}/variants/{variant_id}.json"
         response = self.client.put(url, json={"variant": payload})
         response.raise_for_status()
         return response.json().get("variant")
 
 
     def create_variant(self, product_id: int, payload: dict):
-        url = f"{BASE_URL}/products/{product_id}/variants.json"
+        url = f"{self.base_url}/products/{product_id}/variants.json"
         response = self.client.post(url, json={"variant": payload})
         response.raise_for_status()
         return response.json().get("variant")
+
+
+    def _send(self, method: str, url: str, max_retries: int = 5, **kwargs) -> httpx.Response:
+        # REST rate limit (429): honour Retry-After and try again
+        for attempt in range(max_retries + 1):
+            response = self.client.request(method, url, **kwargs)
+
+            if response.status_code == 429 and attempt < max_retries:
+                time.sleep(float(response.headers.get("Retry-After", 2 ** attempt)))
+                continue
+
+            return response
+
+    def graphql(self, query: str, variables: dict | None = None, max_retries: int = 5):
+        url = f"{self.base_url}/graphql.json"
+
+        for attempt in range(max_retries + 1):
+            response = self._send("POST", url, max_retries, json={"query": query, "variables": variables or {}})
+
+            response.raise_for_status()
+            body = response.json()
+            errors = body.get("errors") or []
+
+            # Cost based rate limit: wait for the bucket to refill and retry
+            throttled = any((e.get("extensions") or {}).get("code") == "THROTTLED" for e in errors)
+            if throttled and attempt < max_retries:
+                time.sleep(2 ** attempt)
+                continue
+
+            if errors:
+                raise RuntimeError(f"Shopify GraphQL error: {errors}")
+
+            return body.get("data") or {}
+
+    def bulk_update_variants(self, updates: Dict[int, List[dict]]) -> Dict[int, List[dict]]:
+        """
+        Update variants of several products in one request:
+        one aliased productVariantsBulkUpdate per product.
+
+        updates: product_id -> [{"id": <variant id>, "price": ..., ...}]
+        Returns product_id -> userErrors
+        """
+
+        if not updates:
+            return {}
+
+        product_ids = list(updates)
+        declarations = []
+        mutations = []
+        variables = {}
+
+        for i, product_id in enumerate(product_ids):
+            declarations.append(f"$p{i}: ID!, $v{i}: [ProductVariantsBulkInput!]!")
+            mutations.append(
+                f"p{i}: productVariantsBulkUpdate(productId: $p{i}, variants: $v{i}) "
+                "{ userErrors { field message } }"
+            )
+            variables[f"p{i}"] = f"gid://shopify/Product/{product_id}"
+            variables[f"v{i}"] = [
+                {**v, "id": f"gid://shopify/ProductVariant/{v['id']}"}
+                for v in updates[product_id]
+            ]
+
+        query = f"mutation({', '.join(declarations)}) {{ {' '.join(mutations)} }}"
+        data = self.graphql(query, variables)
+
+        return {
+            product_id: (data.get(f"p{i}") or {}).get("userErrors", [])
+            for i, product_id in enumerate(product_ids)
+        }
@@ -0,0 +1,124 @@
+"""
+Cold start benchmark for the API process.
+
+Each run starts a fresh interpreter and measures:
+- import:         `import app.main`
+- startup:        app lifespan (shared Shopify client creation)
+- first_request:  first GET /health
+- first_import:   first POST /import/products with a tiny CSV, against a
+                  mocked Shopify transport (pays the lazy pandas import)
+- heavy_modules:  whether pandas / openpyxl got imported before any file was parsed
+
+Usage (from backend/):
+    python benchmarks/startup_benchmark.py --runs 10
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+MEASURE = r"""
+import json, sys, time
+
+t0 = time.perf_counter()
+import app.main
+t1 = time.perf_counter()
+
+# harness only, not part of the app's cold start
+import httpx
+from fastapi.testclient import TestClient
+
+CSV = (
+    "Handle,Title,Variant SKU,Variant Price\n"
+    "bench-shirt,Bench Shirt,BENCH-S,19.99\n"
+    "bench-shirt,Bench Shirt,BENCH-M,19.99\n"
+)
+
+
+def shopify(request):
+    # Just enough of the Admin API for one create-product import
+    path = request.url.path
+    if request.method == "GET" and path.endswith("/products.json"):
+        return httpx.Response(200, json={"products": []})
+    if request.method == "POST" and path.endswith("/products.json"):
+        return httpx.Response(201, json={"product": {"id": 1, "variants": []}})
+    if request.method == "GET" and path.endswith("/products/1.json"):
+        return httpx.Response(200, json={"product": {"id": 1, "variants": []}})
+    if request.method == "POST" and path.endswith("/variants.json"):
+        return httpx.Response(201, json={"variant": {"id": 2}})
+    return httpx.Response(404)
+
+
+t_harness = time.perf_counter()
+
+with TestClient(app.main.app) as client:
+    t2 = time.perf_counter()
+    heavy_modules = sorted(m for m in ("pandas", "openpyxl") if m in sys.modules)
+
+    client.get("/health")
+    t3 = time.perf_counter()
+
+    shopify_client = app.main.app.state.shopify_client
+    shopify_client.client.close()
+    shopify_client.client = httpx.Client(transport=httpx.MockTransport(shopify))
+
+    response = client.post(
+        "/import/products",
+        files={"file": ("bench.csv", CSV.encode(), "text/csv")},
+    )
+    response.raise_for_status()
+    t4 = time.perf_counter()
+
+print(json.dumps({
+    "import": t1 - t0,
+    "startup": t2 - t_harness,
+    "first_request": t3 - t2,
+    "first_import": t4 - t3,
+    "heavy_modules": heavy_modules,
+}))
+"""
+
+
+def run_once() -> dict:
+    env = {
+        # No network calls are made; dummy values only satisfy config validation
+        "SHOPIFY_STORE_URL": "benchmark.myshopify.com",
+        "SHOPIFY_ACCESS_TOKEN": "benchmark",
+        **os.environ,
+    }
+
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE],
+        cwd=BACKEND_DIR,
+        env=env,
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    results = [run_once() for _ in range(args.runs)]
+
+    for key in ("import", "startup", "first_request", "first_import"):
+        values = [r[key] * 1000 for r in results]
+        print(f"{key:<14} median {statistics.median(values):8.1f} ms   min {min(values):8.1f} ms   max {max(values):8.1f} ms")
+
+    heavy_modules = sorted({m for r in results for m in r["heavy_modules"]})
+    print(f"heavy modules loaded at startup: {heavy_modules or 'none'}")
+
+    if heavy_modules:
+        sys.exit(f"lazy loading regressed: {', '.join(heavy_modules)} imported before any file was parsed")
+
+
+if __name__ == "__main__":
+    main()
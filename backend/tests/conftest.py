@@ -0,0 +1,28 @@
+import httpx
+import pytest
+
+
+@pytest.fixture
+def shopify_env(monkeypatch):
+    monkeypatch.setenv("SHOPIFY_STORE_URL", "test-store.myshopify.com")
+    monkeypatch.setenv("SHOPIFY_ACCESS_TOKEN", "test-token")
+
+
+@pytest.fixture
+def mock_shopify_client(shopify_env, monkeypatch):
+    """
+    Build a real ShopifyClient whose HTTP calls go to `handler`
+    (an httpx.MockTransport handler). Retry sleeps are skipped.
+    """
+
+    from app.shopify import client as client_module
+
+    monkeypatch.setattr(client_module.time, "sleep", lambda seconds: None)
+
+    def build(handler):
+        shopify_client = client_module.ShopifyClient()
+        shopify_client.client.close()
+        shopify_client.client = httpx.Client(transport=httpx.MockTransport(handler))
+        return shopify_client
+
+    return build
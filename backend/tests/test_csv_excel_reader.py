@@ -0,0 +1,80 @@
+import openpyxl
+import pytest
+
+from app.parser.csv_excel_reader import read_records, shutdown_sheet_pool
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    # three brand sheets, so reading goes through the worker pool
+    path = tmp_path / "brands.xlsx"
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+
+    for brand, skus in [("Brand C", ["C1", "C2"]), ("Brand A", ["A1"]), ("Brand B", ["B1"])]:
+        ws = wb.create_sheet(brand)
+        ws.append(["Handle", "Variant SKU"])
+        for sku in skus:
+            ws.append([brand.lower().replace(" ", "-"), sku])
+
+    wb.save(path)
+
+    yield str(path)
+
+    shutdown_sheet_pool()
+
+
+def test_csv_rows_keep_file_row_numbers(tmp_path):
+    path = tmp_path / "products.csv"
+    path.write_text("Handle,Variant SKU\n\nshirt,A\n,\nshirt,B\n")
+
+    records = read_records(str(path))
+
+    assert [(r["row"], r["data"]["Variant SKU"]) for r in records] == [(3, "A"), (5, "B")]
+    assert all(r["sheet"] is None for r in records)
+
+
+def test_xlsx_rows_keep_sheet_and_row_numbers(tmp_path):
+    path = tmp_path / "products.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Brand A"
+    ws.append(["Handle", "Variant SKU", "Tags", "Tags"])
+    ws.append([None, None, None, None])
+    ws.append(["shirt", "A", "x"])
+    wb.save(path)
+
+    records = read_records(str(path))
+
+    assert records == [{
+        "sheet": "Brand A",
+        "row": 3,
+        "data": {"Handle": "shirt", "Variant SKU": "A", "Tags": "x", "Tags.1": None},
+    }]
+
+
+def test_xlsx_reads_every_sheet_in_workbook_order(workbook):
+    records = read_records(workbook)
+
+    assert [(r["sheet"], r["row"], r["data"]["Variant SKU"]) for r in records] == [
+        ("Brand C", 2, "C1"),
+        ("Brand C", 3, "C2"),
+        ("Brand A", 2, "A1"),
+        ("Brand B", 2, "B1"),
+    ]
+
+
+def test_xlsx_reads_only_requested_sheets(workbook):
+    records = read_records(workbook, ["Brand B", "Brand C"])
+
+    # workbook order, not request order
+    assert [(r["sheet"], r["data"]["Variant SKU"]) for r in records] == [
+        ("Brand C", "C1"),
+        ("Brand C", "C2"),
+        ("Brand B", "B1"),
+    ]
+
+
+def test_xlsx_missing_sheet_raises(workbook):
+    with pytest.raises(ValueError, match="Sheet\\(s\\) not found in workbook: Brand Z"):
+        read_records(workbook, ["Brand A", "Brand Z"])
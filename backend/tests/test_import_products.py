@@ -0,0 +1,87 @@
+from fastapi.testclient import TestClient
+
+
+def test_import_unknown_sheet_returns_400(shopify_env, tmp_path):
+    import openpyxl
+    from app.main import app
+
+    path = tmp_path / "products.xlsx"
+    wb = openpyxl.Workbook()
+    wb.active.title = "Brand A"
+    wb.active.append(["Handle", "Variant SKU"])
+    wb.save(path)
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/import/products",
+            files={"file": ("products.xlsx", path.read_bytes())},
+            data={"sheets": "Brand Z"},
+        )
+
+    assert response.status_code == 400
+    assert "Brand Z" in response.json()["detail"]
+
+
+def test_import_price_list_uses_variant_patch_mode(shopify_env):
+    import json
+
+    import httpx
+    from app.main import app
+
+    catalog = {"products": [{
+        "id": 1,
+        "handle": "shirt",
+        "variants": [
+            {"id": 11, "sku": "A", "price": "10.00", "weight": 0.3, "weight_unit": "kg"},
+            {"id": 12, "sku": "B", "price": "10.00", "weight": 0.3, "weight_unit": "kg"},
+        ],
+    }]}
+    graphql_requests = []
+
+    def shopify(request):
+        if request.method == "GET" and request.url.path.endswith("/products.json"):
+            return httpx.Response(200, json=catalog)
+        if request.url.path.endswith("/graphql.json"):
+            graphql_requests.append(json.loads(request.content))
+            return httpx.Response(200, json={"data": {"p0": {"userErrors": []}}})
+        # any product-level call fails the test
+        return httpx.Response(500)
+
+    csv = (
+        b"Handle,Variant ID,Variant SKU,Variant Price\n"
+        b"shirt,,A,12\n"      # updated
+        b"shirt,,A,13\n"      # in-file duplicate SKU
+        b"shirt,12,,14\n"     # updated by Variant ID
+        b"shirt,12,,15\n"     # duplicate Variant ID
+        b"shirt,,Z,1\n"       # unknown SKU
+    )
+
+    with TestClient(app) as client:
+        app.state.shopify_client.client.close()
+        app.state.shopify_client.client = httpx.Client(transport=httpx.MockTransport(shopify))
+
+        response = client.post("/import/products", files={"file": ("prices.csv", csv, "text/csv")})
+
+    summary = response.json()
+    assert summary["mode"] == "variant_patch"
+    assert summary["variants_updated"] == 2
+    assert [e["row"] for e in summary["errors"]] == [6]
+
+    with open(f"/tmp/import_result_{summary['download_id']}.json") as f:
+        row_results = json.load(f)
+
+    assert [(r["row"], r["status"]) for r in row_results] == [
+        (2, "updated"),
+        (3, "skipped"),
+        (4, "updated"),
+        (5, "skipped"),
+        (6, "error"),
+    ]
+    assert "Duplicate SKU 'A'" in row_results[1]["error"]
+    assert "Duplicate variant 12" in row_results[3]["error"]
+
+    assert len(graphql_requests) == 1
+    assert graphql_requests[0]["variables"]["v0"] == [
+        {"id": "gid://shopify/ProductVariant/11", "price": "12.0"},
+        {"id": "gid://shopify/ProductVariant/12", "price": "14.0"},
+    ]
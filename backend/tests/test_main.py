@@ -0,0 +1,78 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def test_import_app_does_not_load_heavy_modules():
+    # fresh interpreter: the test process itself already imported pandas
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys; import app.main; "
+            "print(json.dumps([m for m in ('pandas', 'openpyxl') if m in sys.modules]))",
+        ],
+        cwd=BACKEND_DIR,
+        text=True,
+    )
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+
+@pytest.fixture
+def app_client(shopify_env, monkeypatch):
+    """
+    App with its lifespan started and the shared Shopify client mocked.
+    Building any other ShopifyClient fails the test.
+    """
+
+    from app.main import app
+    from app.shopify.client import ShopifyClient
+
+    def shopify(request):
+        path = request.url.path
+        if request.method == "GET" and path.endswith("/products.json"):
+            return httpx.Response(200, json={"products": []})
+        if request.method == "POST" and path.endswith("/products.json"):
+            return httpx.Response(201, json={"product": {"id": 1, "variants": []}})
+        if request.method == "GET" and path.endswith("/products/1.json"):
+            return httpx.Response(200, json={"product": {"id": 1, "variants": []}})
+        if request.method == "POST" and path.endswith("/variants.json"):
+            return httpx.Response(201, json={"variant": {"id": 2}})
+        return httpx.Response(404)
+
+    with TestClient(app) as client:
+        shared = app.state.shopify_client
+        shared.client.close()
+        shared.client = httpx.Client(transport=httpx.MockTransport(shopify))
+
+        def no_new_clients(self, *args, **kwargs):
+            raise AssertionError("a new ShopifyClient was created instead of the shared one")
+
+        monkeypatch.setattr(ShopifyClient, "__init__", no_new_clients)
+
+        yield client
+
+
+def test_shopify_test_uses_shared_client(app_client):
+    response = app_client.get("/shopify/test")
+
+    assert response.status_code == 200
+    assert response.json() == {"products": []}
+
+
+def test_import_products_uses_shared_client(app_client):
+    csv = b"Handle,Title,Variant SKU,Variant Price\nshirt,Shirt,S-1,19.99\n"
+
+    response = app_client.post("/import/products", files={"file": ("products.csv", csv, "text/csv")})
+
+    assert response.status_code == 200
+    assert response.json()["products_created"] == 1
+    assert response.json()["variants_created"] == 1
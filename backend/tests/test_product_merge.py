@@ -0,0 +1,77 @@
+from app.services.product_merge import ProductMergeService
+
+
+def _service():
+    # only the pure conflict helpers are exercised, no Shopify calls
+    return ProductMergeService(client=object())
+
+
+def _owner(product_id=1, variant_id=11, handle="shirt"):
+    return {"product_id": product_id, "variant_id": variant_id, "handle": handle}
+
+
+def test_owns_sku_matches_by_product_id():
+    assert _service()._owns_sku(_owner(), {"id": "1", "handle": "other"}, {"sku": "A"})
+
+
+def test_owns_sku_matches_by_handle():
+    assert _service()._owns_sku(_owner(), {"id": None, "handle": "shirt"}, {"sku": "A"})
+
+
+def test_owns_sku_rejects_other_product():
+    assert not _service()._owns_sku(_owner(), {"id": "2", "handle": "pants"}, {"sku": "A"})
+
+
+def test_owns_sku_accepts_float_variant_id():
+    # pandas reads numeric ID columns as floats
+    assert _service()._owns_sku(_owner(), {"handle": "shirt"}, {"sku": "A", "id": 11.0})
+
+
+def test_owns_sku_rejects_other_variant_of_same_product():
+    assert not _service()._owns_sku(_owner(), {"handle": "shirt"}, {"sku": "A", "id": 12.0})
+
+
+def test_owns_sku_ignores_nan_variant_id():
+    assert _service()._owns_sku(_owner(), {"handle": "shirt"}, {"sku": "A", "id": float("nan")})
+
+
+def test_find_sku_conflicts_drops_conflicting_variants():
+    products = [{
+        "handle": "pants",
+        "variants": [{"sku": "A"}, {"sku": "NEW"}],
+    }]
+
+    remaining, conflicts = _service().find_sku_conflicts(products, {"A": [_owner()]})
+
+    assert [v["sku"] for v in remaining[0]["variants"]] == ["NEW"]
+    assert [c["sku"] for c in conflicts] == ["A"]
+    assert "product 1, variant 11" in conflicts[0]["error"]
+
+
+def test_find_sku_conflicts_drops_product_without_variants_left():
+    products = [{"handle": "pants", "variants": [{"sku": "A"}]}]
+
+    remaining, conflicts = _service().find_sku_conflicts(products, {"A": [_owner()]})
+
+    assert remaining == []
+    assert len(conflicts) == 1
+
+
+def test_find_sku_conflicts_keeps_product_without_variants():
+    products = [{"handle": "pants", "variants": []}]
+
+    remaining, conflicts = _service().find_sku_conflicts(products, {})
+
+    assert remaining == products
+    assert conflicts == []
+
+
+def test_find_sku_conflicts_flags_sku_shared_with_another_product():
+    # the targeted product owns the SKU, but so does another one
+    products = [{"handle": "shirt", "variants": [{"sku": "A"}]}]
+    sku_index = {"A": [_owner(), _owner(product_id=2, variant_id=21, handle="pants")]}
+
+    remaining, conflicts = _service().find_sku_conflicts(products, sku_index)
+
+    assert remaining == []
+    assert "product 2, variant 21" in conflicts[0]["error"]
@@ -0,0 +1,102 @@
+import json
+
+import httpx
+import pytest
+
+
+def test_iter_products_follows_next_link(mock_shopify_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request.url)
+
+        if request.url.params.get("page_info") == "page2":
+            return httpx.Response(200, json={"products": [{"id": 2}]})
+
+        next_url = f"{request.url.copy_with(query=None)}?limit=250&fields=id&page_info=page2"
+        return httpx.Response(
+            200,
+            json={"products": [{"id": 1}]},
+            headers={"Link": f'<{next_url}>; rel="next"'},
+        )
+
+    client = mock_shopify_client(handler)
+
+    assert [p["id"] for p in client.iter_products(fields="id")] == [1, 2]
+    assert requests[0].params["fields"] == "id"
+    assert requests[0].params["limit"] == "250"
+    assert requests[1].params["page_info"] == "page2"
+
+
+def test_iter_products_retries_rate_limit(mock_shopify_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "2.0"})
+        return httpx.Response(200, json={"products": [{"id": 1}]})
+
+    client = mock_shopify_client(handler)
+
+    assert [p["id"] for p in client.iter_products()] == [1]
+    assert len(calls) == 2
+
+
+def _graphql_body(request):
+    return json.loads(request.content)
+
+
+def test_bulk_update_variants_sends_one_aliased_mutation_per_product(mock_shopify_client):
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": {
+            "p0": {"userErrors": []},
+            "p1": {"userErrors": [{"field": ["variants", "0", "price"], "message": "bad price"}]},
+        }})
+
+    client = mock_shopify_client(handler)
+
+    user_errors = client.bulk_update_variants({
+        1: [{"id": 11, "price": "12.0"}],
+        2: [{"id": 21, "compareAtPrice": "15.0"}],
+    })
+
+    assert len(requests) == 1
+    assert requests[0].url.path.endswith("/graphql.json")
+
+    body = _graphql_body(requests[0])
+    assert "p0: productVariantsBulkUpdate(productId: $p0, variants: $v0)" in body["query"]
+    assert "p1: productVariantsBulkUpdate(productId: $p1, variants: $v1)" in body["query"]
+    assert body["variables"] == {
+        "p0": "gid://shopify/Product/1",
+        "v0": [{"id": "gid://shopify/ProductVariant/11", "price": "12.0"}],
+        "p1": "gid://shopify/Product/2",
+        "v1": [{"id": "gid://shopify/ProductVariant/21", "compareAtPrice": "15.0"}],
+    }
+
+    assert user_errors == {1: [], 2: [{"field": ["variants", "0", "price"], "message": "bad price"}]}
+
+
+def test_graphql_retries_throttled_and_rate_limited(mock_shopify_client):
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "1"}),
+        httpx.Response(200, json={"errors": [{"message": "Throttled", "extensions": {"code": "THROTTLED"}}]}),
+        httpx.Response(200, json={"data": {"ok": True}}),
+    ]
+
+    client = mock_shopify_client(lambda request: responses.pop(0))
+
+    assert client.graphql("{ ok }") == {"ok": True}
+    assert responses == []
+
+
+def test_graphql_raises_other_errors(mock_shopify_client):
+    client = mock_shopify_client(
+        lambda request: httpx.Response(200, json={"errors": [{"message": "Variable $v0 invalid"}]})
+    )
+
+    with pytest.raises(RuntimeError, match="Variable \\$v0 invalid"):
+        client.graphql("{ ok }")
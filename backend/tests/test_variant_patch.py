@@ -0,0 +1,146 @@
+from app.services.variant_patch import (
+    VariantPatchService,
+    is_variant_patch_file,
+    _failed_variants,
+    _same_number,
+)
+
+
+class FakeClient:
+    def __init__(self, api_version="2025-01", fail_products=()):
+        self.api_version = api_version
+        self.fail_products = set(fail_products)
+        self.requests = []
+
+    def bulk_update_variants(self, updates):
+        self.requests.append(updates)
+        if self.fail_products & set(updates):
+            raise RuntimeError("Shopify GraphQL error")
+        return {pid: [] for pid in updates}
+
+
+def _entry(variant_id=11, product_id=1, sku="A", handle="shirt", **fields):
+    return {
+        "product_id": product_id,
+        "variant_id": variant_id,
+        "handle": handle,
+        "sku": sku,
+        "price": "10.00",
+        "compare_at_price": None,
+        "weight": 0.3,
+        "weight_unit": "lb",
+        **fields,
+    }
+
+
+def _catalog(*entries):
+    catalog = {"skus": {}, "variants": {}}
+    for e in entries:
+        catalog["variants"][str(e["variant_id"])] = e
+        catalog["skus"].setdefault(e["sku"], []).append(e)
+    return catalog
+
+
+def _row(handle="shirt", **variant):
+    return {"product": {"handle": handle}, "variant": variant}
+
+
+def test_is_variant_patch_file():
+    assert is_variant_patch_file(["Handle", "Variant SKU", "Variant Price", "Variant Compare At Price"])
+    assert is_variant_patch_file(["Variant ID", "Variant Weight"])
+    assert not is_variant_patch_file(["Handle", "Title", "Variant SKU", "Variant Price"])
+    assert not is_variant_patch_file(["Handle", "Variant Price"])
+
+
+def test_same_number():
+    assert _same_number(19.99, "19.99")
+    assert _same_number(10, "10.00")
+    assert not _same_number(10.5, "10.00")
+    assert not _same_number(10.0, None)
+    assert not _same_number(10.0, "")
+
+
+def test_build_variant_patch_only_changed_fields():
+    service = VariantPatchService(FakeClient())
+
+    patch = service.build_variant_patch({"price": 12.5, "compare_at_price": 15.0}, _entry())
+    assert patch == {"price": "12.5", "compareAtPrice": "15.0"}
+
+    assert service.build_variant_patch({"price": 10.0, "weight": 0.3}, _entry()) == {}
+
+
+def test_build_variant_patch_ignores_blank_cells():
+    service = VariantPatchService(FakeClient())
+
+    assert service.build_variant_patch(
+        {"price": None, "compare_at_price": float("nan"), "weight": float("nan")}, _entry()
+    ) == {}
+
+
+def test_build_variant_patch_weight_uses_inventory_item_measurement():
+    service = VariantPatchService(FakeClient(api_version="2025-01"))
+
+    patch = service.build_variant_patch({"weight": 0.5}, _entry())
+
+    assert patch == {"inventoryItem": {"measurement": {"weight": {"value": 0.5, "unit": "POUNDS"}}}}
+
+
+def test_build_variant_patch_weight_on_old_api_version():
+    service = VariantPatchService(FakeClient(api_version="2024-01"))
+
+    patch = service.build_variant_patch({"weight": 0.5}, _entry(weight_unit="kg"))
+
+    assert patch == {"weight": 0.5, "weightUnit": "KILOGRAMS"}
+
+
+def test_failed_variants_maps_index_to_key():
+    variants = [("A", {}), ("B", {})]
+
+    failed = _failed_variants(variants, [{"field": ["variants", "1", "price"], "message": "bad price"}])
+
+    assert failed == {"B": "bad price"}
+
+
+def test_failed_variants_without_index_fails_whole_product():
+    variants = [("A", {}), ("B", {})]
+
+    failed = _failed_variants(variants, [{"field": ["productId"], "message": "Product not found"}])
+
+    assert failed == {"A": "Product not found", "B": "Product not found"}
+
+
+def test_apply_resolves_by_variant_id_without_sku():
+    client = FakeClient()
+    outcomes = VariantPatchService(client).apply([_row(id=11.0, price=12.0)], _catalog(_entry()))
+
+    assert outcomes[0]["status"] == "updated"
+    assert client.requests == [{1: [{"id": 11, "price": "12.0"}]}]
+
+
+def test_apply_rejects_variant_id_and_sku_mismatch():
+    catalog = _catalog(_entry(), _entry(variant_id=12, sku="B"))
+
+    outcomes = VariantPatchService(FakeClient()).apply([_row(id=11, sku="B", price=12.0)], catalog)
+
+    assert outcomes[0]["status"] == "error"
+    assert "has SKU 'A'" in outcomes[0]["error"]
+
+
+def test_apply_failed_batch_does_not_fail_other_products():
+    catalog = _catalog(_entry(), _entry(variant_id=21, product_id=2, sku="C", handle="pants"))
+    rows = [_row(sku="A", price=12.0), _row(handle="pants", sku="C", price=12.0)]
+
+    outcomes = VariantPatchService(FakeClient(fail_products=[2])).apply(rows, catalog)
+
+    assert [o["status"] for o in outcomes] == ["updated", "error"]
+
+
+def test_apply_skips_repeated_variant_id_rows():
+    client = FakeClient()
+    rows = [_row(id=11, price=12.0), _row(id=11.0, price=13.0)]
+
+    outcomes = VariantPatchService(client).apply(rows, _catalog(_entry()))
+
+    assert [o["status"] for o in outcomes] == ["updated", "skipped"]
+    assert "Duplicate variant 11" in outcomes[1]["error"]
+    assert client.requests == [{1: [{"id": 11, "price": "12.0"}]}]